@@ -1,78 +1,37 @@
 """Chatbot implementation for interacting with users and executing tools."""
 
+import asyncio
+import itertools
 import os
+from collections import deque
 from datetime import date
-from typing import Any, Dict, List
-
-import anthropic
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
 
 from robots.registry import ToolRegistry
 
 
-class Chatbot:
-    """Chatbot for interacting with users and executing tools."""
+# Files whose contents are embedded in the system prompt
+PROMPT_FILES = ("memory.txt", "user_info.md", "history.txt")
 
-    def __init__(self, registry: ToolRegistry):
-        """Initialize the chatbot.
-        
-        Args:
-            registry: The tool registry to use for executing tools.
-        """
-        self.client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-        self.registry = registry
-        self.messages = []
-        
-        # Initialize with system message
-        memory_content = ""
-        try:
-            with open("memory.txt", "r") as f:
-                memory_content = f.read()
-        except FileNotFoundError:
-            # Create the file if it doesn't exist
-            with open("memory.txt", "w") as f:
-                pass
+# Maximum number of messages kept in the conversation history
+MAX_HISTORY_MESSAGES = 20
 
-        user_info = ""
-        try:
-            with open("user_info.md", "r") as f:
-                user_info = f.read()
-        except FileNotFoundError:
-            # Create the file if it doesn't exist
-            with open("user_info.md", "w") as f:
-                pass
-        
-        history = ""
-        try:
-            with open("history.txt", "r") as f:
-                history = f.read()
-        except FileNotFoundError:
-            # Create the file if it doesn't exist
-            with open("history.txt", "w") as f:
-                pass
+# Number of recent turns whose tool results are sent in full
+KEPT_TOOL_RESULT_TURNS = 2
 
-        self.messages.append({
-            "role": "user",
-            "content": f"""
+# Number of dropped user messages summarized, and the characters kept from each
+SUMMARIZED_PROMPTS = 10
+SUMMARIZED_PROMPT_CHARS = 200
+
+# Seconds to wait for the next streamed event before giving up on a response
+STREAM_IDLE_TIMEOUT = 30
+
+# Static part of the system prompt; kept free of per-session data so it can be cached
+_STATIC_SYSTEM_PROMPT = """
 You are an AI chat bot named Astro, being interacted with in a terminal chat application.
 You are a "robo advisor" that is helping a user manage their investments.
 You can use the information to make investment recommendations or answer user questions.
 
-<current_date>
-{date.today().strftime("%m/%d/%Y")}
-</current_date>
-
-<memory>
-{memory_content}
-</memory>
-
-<user_info>
-{user_info}
-</user_info>
-
-<history>
-{history}
-</history>
-
 <capabilities>
 You have access to real-time stock market data through yfinance. 
 You can retrieve historical stock prices, company information, and performance metrics for any publicly traded company.
@@ -120,19 +79,138 @@ Use plain text in communication.
 If you want to provide emphasis, use *asterisks* around the text.
 Use spacing and newlines to make the text easier to read.
 </style>
-            """.strip()
-        })
+""".strip()
+
+# Per-session context that follows the static system prompt
+_CONTEXT_TEMPLATE = """
+<current_date>
+{current_date}
+</current_date>
+
+<memory>
+{memory}
+</memory>
+
+<user_info>
+{user_info}
+</user_info>
+
+<history>
+{history}
+</history>
+""".strip()
+
+
+class Chatbot:
+    """Chatbot for interacting with users and executing tools."""
+
+    # Last rendered context, keyed by the date and prompt file states
+    _context_cache: Optional[Tuple[Tuple[Any, ...], str]] = None
+
+    def __init__(self, registry: ToolRegistry, max_history: int = MAX_HISTORY_MESSAGES):
+        """Initialize the chatbot.
+        
+        Args:
+            registry: The tool registry to use for executing tools.
+            max_history: The maximum number of messages kept in the history.
+        """
+        import anthropic
+        
+        self.client = anthropic.AsyncAnthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+        self.registry = registry
+        self.max_history = max_history
+        self.messages: Deque[Dict[str, Any]] = deque()
+        
+        # Most recent user messages dropped from the history, oldest first
+        self.earlier_prompts: Deque[str] = deque(maxlen=SUMMARIZED_PROMPTS)
+        
+        # Only the static prompt is marked for caching; the context changes between sessions
+        self.system = [{
+            "type": "text",
+            "text": _STATIC_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }, {
+            "type": "text",
+            "text": self._context()
+        }]
+
+    @classmethod
+    def _context(cls) -> str:
+        """Render the per-session context for the system prompt.
+        
+        The rendered context is reused until the date changes or one of the
+        prompt files is modified.
+        
+        Returns:
+            The rendered context.
+        """
+        today = date.today()
+        if cls._context_cache is not None:
+            key, context = cls._context_cache
+            if key == (today, tuple(cls._file_state(path) for path in PROMPT_FILES)):
+                return context
+        
+        (memory, memory_state), (user_info, user_info_state), (history, history_state) = (
+            cls._read_or_create(path) for path in PROMPT_FILES
+        )
+        context = _CONTEXT_TEMPLATE.format(
+            current_date=today.strftime("%m/%d/%Y"),
+            memory=memory,
+            user_info=user_info,
+            history=history
+        )
+        cls._context_cache = ((today, (memory_state, user_info_state, history_state)), context)
+        return context
+
+    @staticmethod
+    def _file_state(path: str) -> Optional[Tuple[int, int]]:
+        """Get the modification time and size of a file.
+        
+        Args:
+            path: The path of the file.
+            
+        Returns:
+            The modification time in nanoseconds and the size in bytes, or
+            None if the file doesn't exist.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _read_or_create(path: str) -> Tuple[str, Tuple[int, int]]:
+        """Read the contents of a file, creating it if it doesn't exist.
+        
+        The file is opened once, with O_CREAT, for both the read and the stat.
+        
+        Args:
+            path: The path of the file.
+            
+        Returns:
+            The file contents, and its modification time in nanoseconds and
+            size in bytes.
+        """
+        fd = os.open(path, os.O_RDONLY | os.O_CREAT, 0o644)
+        with open(fd, "r") as f:
+            stat = os.fstat(fd)
+            return f.read(), (stat.st_mtime_ns, stat.st_size)
     
-    async def send_message(self, message: str) -> str:
-        """Send a message to the chatbot and get a response.
+    async def send_message(self, message: str) -> AsyncIterator[str]:
+        """Send a message to the chatbot and stream its response.
         
         Args:
             message: The message to send.
             
-        Returns:
-            The chatbot's response.
+        Yields:
+            Chunks of the chatbot's response text as they are generated.
+            
+        Raises:
+            TimeoutError: If the response stream stalls for longer than
+                STREAM_IDLE_TIMEOUT seconds.
         """
-        result = []
+        text_started = False
         
         self.messages.append({
             "role": "user",
@@ -143,42 +221,152 @@ Use spacing and newlines to make the text easier to read.
         while tool_used:
             tool_used = False
             
-            response = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",  # 'claude-3-7-sonnet-20250219'
-                max_tokens=8192,
-                system="You are an AI chat bot named Astro...",
-                messages=self.messages,
-                tools=self.registry.get_tools_info()
+            # Start each tool as soon as its block finishes streaming, so tool I/O
+            # overlaps with the rest of the response
+            pending_tools: Dict[str, asyncio.Task] = {}
+            try:
+                async with self.client.messages.stream(
+                    model="claude-3-5-sonnet-20241022",  # 'claude-3-7-sonnet-20250219'
+                    max_tokens=8192,
+                    system=self.system,
+                    messages=self._request_messages(),
+                    tools=self.registry.get_tools_info()
+                ) as stream:
+                    events = aiter(stream)
+                    while True:
+                        try:
+                            event = await asyncio.wait_for(anext(events), STREAM_IDLE_TIMEOUT)
+                        except StopAsyncIteration:
+                            break
+                        except asyncio.TimeoutError:
+                            raise TimeoutError(f"No response from the model for {STREAM_IDLE_TIMEOUT} seconds")
+                        
+                        if event.type == "content_block_start" and event.content_block.type == "text" and text_started:
+                            # Separate text blocks the same way across tool rounds
+                            yield "\n"
+                        elif event.type == "text":
+                            text_started = True
+                            yield event.text
+                        elif event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                            block = event.content_block
+                            pending_tools[block.id] = asyncio.create_task(self.registry.execute(block.name, block.input))
+                    response = await stream.get_final_message()
+            except BaseException:
+                # Don't leave tools started mid-stream running after a failed round
+                for task in pending_tools.values():
+                    if not task.done():
+                        task.cancel()
+                raise
+            
+            # Record the whole response as a single assistant turn, reusing the SDK's own
+            # serialization of each block; empty text blocks are rejected by the API
+            content_blocks = [
+                content.model_dump(exclude_none=True)
+                for content in response.content
+                if content.type != "text" or content.text
+            ]
+            tool_uses = [content for content in response.content if content.type == "tool_use"]
+            
+            # Wait for all tools together; latency is that of the slowest one
+            tool_results = await asyncio.gather(
+                *(pending_tools.get(content.id) or self.registry.execute(content.name, content.input) for content in tool_uses),
+                return_exceptions=True
             )
             
-            for content in response.content:
-                if content.type == "text":
-                    self.messages.append({
-                        "role": "assistant",
-                        "content": content.text
-                    })
-                    result.append(content.text)
-                elif content.type == "tool_use":
-                    tool_used = True
-                    self.messages.append({
-                        "role": "assistant",
-                        "content": [{
-                            "type": "tool_use",
-                            "id": content.id,
-                            "name": content.name,
-                            "input": content.input
-                        }]
-                    })
-                    
-                    tool_result = await self.registry.execute(content.name, content.input)
-                    
-                    self.messages.append({
-                        "role": "user",
-                        "content": [{
-                            "type": "tool_result",
-                            "tool_use_id": content.id,
-                            "content": tool_result
-                        }]
-                    })
-        
-        return "\n".join(result) 
\ No newline at end of file
+            round_messages = []
+            if content_blocks:
+                round_messages.append({
+                    "role": "assistant",
+                    "content": content_blocks
+                })
+            
+            # Every tool_use needs a result, but only ask the model to continue
+            # when it stopped to wait for them
+            if tool_uses:
+                tool_used = response.stop_reason == "tool_use"
+                round_messages.append({
+                    "role": "user",
+                    "content": [
+                        self._tool_result_block(content.id, tool_result)
+                        for content, tool_result in zip(tool_uses, tool_results)
+                    ]
+                })
+            
+            # Add the round in one step so a tool_use is never stored without its result
+            self.messages.extend(round_messages)
+        
+        self._compact_history()
+
+    @staticmethod
+    def _tool_result_block(tool_use_id: str, tool_result: Any) -> Dict[str, Any]:
+        """Build a tool_result content block.
+        
+        Args:
+            tool_use_id: The ID of the tool_use block being answered.
+            tool_result: The tool's output, or the exception it raised.
+            
+        Returns:
+            The tool_result content block.
+        """
+        if isinstance(tool_result, Exception):
+            return {
+                "type": "tool_result",
+                "tool_use_id": tool_use_id,
+                "is_error": True,
+                "content": str(tool_result)
+            }
+        return {
+            "type": "tool_result",
+            "tool_use_id": tool_use_id,
+            "content": tool_result
+        }
+
+    def _request_messages(self) -> List[Dict[str, Any]]:
+        """Build the messages to send, led by a summary of dropped turns.
+        
+        Returns:
+            The messages for the next request.
+        """
+        messages = list(self.messages)
+        if self.earlier_prompts:
+            prompts = "\n".join(f"- {prompt}" for prompt in self.earlier_prompts)
+            messages.insert(0, {
+                "role": "user",
+                "content": f"<earlier_conversation>\nOlder messages were removed from this conversation. Earlier, the user asked:\n{prompts}\n</earlier_conversation>"
+            })
+        return messages
+
+    def _compact_history(self) -> None:
+        """Bound the size of the conversation history.
+        
+        Tool results from all but the most recent turns are replaced with a
+        short placeholder, and the oldest whole turns are dropped once the
+        history exceeds max_history. A turn starts at a plain user message,
+        so tool_use blocks are never separated from their results. The user
+        messages of dropped turns are kept in earlier_prompts.
+        """
+        turn_starts = [
+            i for i, message in enumerate(self.messages)
+            if message["role"] == "user" and isinstance(message["content"], str)
+        ]
+        if not turn_starts:
+            return
+        
+        # Elide tool results from older turns
+        if len(turn_starts) > KEPT_TOOL_RESULT_TURNS:
+            for message in itertools.islice(self.messages, turn_starts[-KEPT_TOOL_RESULT_TURNS]):
+                if message["role"] != "user" or isinstance(message["content"], str):
+                    continue
+                for block in message["content"]:
+                    content = block.get("content")
+                    if block["type"] == "tool_result" and isinstance(content, str) and not content.startswith("<elided "):
+                        block["content"] = f"<elided {len(content.encode())} bytes>"
+        
+        # Drop the oldest turns, always keeping the most recent one
+        excess = len(self.messages) - self.max_history
+        if excess > 0:
+            cut = next((start for start in turn_starts if start >= excess), turn_starts[-1])
+            for _ in range(cut):
+                message = self.messages.popleft()
+                if message["role"] == "user" and isinstance(message["content"], str):
+                    self.earlier_prompts.append(message["content"][:SUMMARIZED_PROMPT_CHARS]) 
\ No newline at end of file
@@ -3,6 +3,8 @@
 import asyncio
 import colorama
 import shutil
+import signal
+from aioconsole import ainput
 from colorama import Fore, Back, Style
 
 from robots.bot import Chatbot
@@ -10,6 +12,7 @@ from robots.registry import ToolRegistry
 from robots.tools.fred_data_tool import FredDataTool
 from robots.tools.memory_tool import MemoryTool
 from robots.tools.stock_info_tool import StockInfoTool
+from robots.utils import http
 
 
 # Initialize colorama
@@ -24,10 +27,28 @@ DRACULA_PINK = Fore.LIGHTMAGENTA_EX
 DRACULA_ORANGE = Fore.LIGHTYELLOW_EX
 DRACULA_BACKGROUND = ""  # Default terminal background
 
+# Terminal width and the strings sized to it, refreshed when the terminal is resized
+TERM_WIDTH = 0
+CLEAR_LINE = ""
+SEPARATOR = ""
+
+
+def update_terminal_size(*_):
+    """Recompute the terminal width and the strings sized to it."""
+    global TERM_WIDTH, CLEAR_LINE, SEPARATOR
+    TERM_WIDTH = shutil.get_terminal_size().columns
+    CLEAR_LINE = " " * TERM_WIDTH
+    SEPARATOR = DRACULA_ORANGE + "─" * TERM_WIDTH + Style.RESET_ALL
+
+
+update_terminal_size()
+if hasattr(signal, "SIGWINCH"):
+    signal.signal(signal.SIGWINCH, update_terminal_size)
+
 
 def print_header():
     """Print a stylish header for the application."""
-    terminal_width = shutil.get_terminal_size().columns
+    terminal_width = TERM_WIDTH
     
     print(DRACULA_PURPLE + Style.BRIGHT + "╔" + "═" * (terminal_width - 2) + "╗" + Style.RESET_ALL)
     
@@ -53,19 +74,26 @@ async def main():
     registry.register(StockInfoTool())
     registry.register(FredDataTool())
     
-    # Create and run chatbot
-    bot = Chatbot(registry)
-    
     # Print stylish header
     print_header()
     
     # Print welcome message
     print(f"{DRACULA_CYAN}Type {DRACULA_YELLOW}{Style.BRIGHT}'exit'{Style.RESET_ALL}{DRACULA_CYAN} to quit the application.{Style.RESET_ALL}\n")
     
+    # Create and run chatbot; this loads the API client, so do it after the header is shown
+    bot = Chatbot(registry)
+    
+    prewarm_task = None
     while True:
+        # Warm up data connections in the background while the user types,
+        # keeping at most one warm-up in flight
+        if prewarm_task is None or prewarm_task.done():
+            prewarm_task = asyncio.create_task(asyncio.to_thread(http.prewarm))
+        
         # User prompt with formatting
-        user_input = input(f"{DRACULA_GREEN}{Style.BRIGHT}You{Style.RESET_ALL}\n")
+        user_input = await ainput(f"{DRACULA_GREEN}{Style.BRIGHT}You{Style.RESET_ALL}\n")
         if user_input.lower() == "exit":
+            prewarm_task.cancel()
             print(f"\n{DRACULA_PURPLE}{Style.BRIGHT}Astro{Style.RESET_ALL}\nGoodbye! Thanks for using Astro Bot.\n")
             break
         
@@ -73,12 +101,19 @@ async def main():
         # Show typing indicator
         print(f"{DRACULA_PURPLE}{Style.BRIGHT}Astro{Style.RESET_ALL} {DRACULA_CYAN}thinking...{Style.RESET_ALL}", end="\r")
         
-        response = await bot.send_message(user_input)
-        
-        # Clear the thinking indicator and print the response
-        print(" " * shutil.get_terminal_size().columns, end="\r")  # Clear the line
-        print(f"{DRACULA_PURPLE}{Style.BRIGHT}Astro{Style.RESET_ALL}\n{response}\n")
-        print(f"{DRACULA_ORANGE}─{Style.RESET_ALL}" * shutil.get_terminal_size().columns)  # Separator line
+        # Clear the thinking indicator once the response starts, then print it as it streams
+        response_started = False
+        try:
+            async for chunk in bot.send_message(user_input):
+                if not response_started:
+                    print(CLEAR_LINE, end="\r")  # Clear the line
+                    print(f"{DRACULA_PURPLE}{Style.BRIGHT}Astro{Style.RESET_ALL}")
+                    response_started = True
+                print(chunk, end="", flush=True)
+        except TimeoutError as e:
+            print(f"\n{DRACULA_YELLOW}Error: {e}{Style.RESET_ALL}", end="")
+        print("\n")
+        print(SEPARATOR)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ class ToolRegistry:
     def __init__(self):
         """Initialize the tool registry."""
         self._tools: Dict[str, Tool] = {}
+        self._tools_info: Optional[List[Dict[str, Any]]] = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool with the registry.
@@ -19,6 +20,7 @@ class ToolRegistry:
             tool: The tool instance to register.
         """
         self._tools[tool.name] = tool
+        self._tools_info = None
 
     def unregister(self, tool_name: str) -> None:
         """Unregister a tool from the registry.
@@ -28,6 +30,7 @@ class ToolRegistry:
         """
         if tool_name in self._tools:
             del self._tools[tool_name]
+            self._tools_info = None
 
     def get_tool(self, name: str) -> Optional[Tool]:
         """Get a tool by name.
@@ -58,11 +61,16 @@ class ToolRegistry:
     def get_tools_info(self) -> List[Dict[str, Any]]:
         """Get information about all registered tools.
         
+        The result is built once and reused until the set of registered
+        tools changes.
+        
         Returns:
             A list of dictionaries containing tool information.
         """
-        return [{
-            "name": tool.name,
-            "description": tool.description,
-            "input_schema": tool.input_schema
-        } for tool in self._tools.values()] 
\ No newline at end of file
+        if self._tools_info is None:
+            self._tools_info = [{
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": tool.input_schema
+            } for tool in self._tools.values()]
+        return self._tools_info 
\ No newline at end of file
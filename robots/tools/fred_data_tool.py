@@ -1,19 +1,58 @@
 """Federal Reserve Economic Data (FRED) tool."""
 
-import json
+import asyncio
 import os
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-import pandas as pd
-from fredapi import Fred
+import msgspec
 
 from robots.tools.base import Tool
-from robots.utils.json_encoder import CustomJSONEncoder
+from robots.utils import cache
+
+if TYPE_CHECKING:
+    from fredapi import Fred
+
+# Upper bound on concurrent requests to the FRED API
+MAX_FRED_WORKERS = 8
+
+# How long fetched data is reused, in seconds
+SERIES_TTL = 24 * 60 * 60
+METADATA_TTL = 30 * 24 * 60 * 60
+
+# Series longer than this are resampled to monthly values when finer than monthly
+MAX_OBSERVATIONS = 500
+
+# Decimal places kept for observation values
+OBSERVATION_DECIMALS = 4
+
+
+class FredDataInput(msgspec.Struct):
+    """Input for the FRED data tool."""
+
+    series_ids: List[str] = []
+    observation_start: Optional[str] = None
+    observation_end: Optional[str] = None
+    include_metadata: bool = True
 
 
 class FredDataTool(Tool):
     """Tool for retrieving economic data from FRED."""
 
+    def __init__(self):
+        """Initialize the FRED data tool."""
+        self._fred: Optional["Fred"] = None
+        # Series metadata is effectively immutable, so keep it for the life of the process
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def fred(self) -> "Fred":
+        """Return the FRED client, creating it on first use."""
+        if self._fred is None:
+            from fredapi import Fred
+            
+            self._fred = Fred(api_key=os.environ.get("FRED_API_KEY"))
+        return self._fred
+
     @property
     def name(self) -> str:
         """Return the name of the tool."""
@@ -64,68 +103,155 @@ class FredDataTool(Tool):
             JSON string with economic data.
         """
         try:
-            series_ids = input_data.get("series_ids", [])
-            observation_start = input_data.get("observation_start", None)
-            observation_end = input_data.get("observation_end", None)
-            include_metadata = input_data.get("include_metadata", True)
+            args = msgspec.convert(input_data, FredDataInput)
             
-            if not series_ids:
+            if not args.series_ids:
                 return "Error: No series IDs provided"
             
-            fred = Fred(api_key=os.environ.get("FRED_API_KEY"))
-            result = {}
+            return await cache.cached_result(
+                self.name, args, SERIES_TTL,
+                lambda: self._fetch(args), self._is_complete
+            )
+        except Exception as e:
+            return f"Error: {str(e)}"
+
+    async def _fetch(self, args: FredDataInput) -> Dict[str, Any]:
+        """Fetch every requested series and, if requested, its metadata.
+        
+        Args:
+            args: The parsed tool input.
             
-            # Get data for each series
-            for series_id in series_ids:
-                try:
-                    data = fred.get_series(series_id, observation_start=observation_start, observation_end=observation_end)
-                    # Convert the Series to a dictionary with string dates
-                    data_dict = {date.strftime('%Y-%m-%d'): float(value) if not pd.isna(value) else None for date, value in data.items()}
-                    
-                    # Calculate summary statistics if we have data
-                    summary = {}
-                    if len(data) > 0:
-                        # Get the most recent value
-                        summary["most_recent_value"] = float(data.iloc[-1]) if not pd.isna(data.iloc[-1]) else None
-                        summary["most_recent_date"] = data.index[-1].strftime('%Y-%m-%d')
-                        
-                        # Calculate percent changes if we have enough data
-                        if len(data) > 1 and not pd.isna(data.iloc[-1]) and not pd.isna(data.iloc[-2]) and data.iloc[-2] != 0:
-                            # Calculate period-over-period change
-                            pop_change = float(((data.iloc[-1] / data.iloc[-2]) - 1) * 100)
-                            summary["period_over_period_pct_change"] = round(pop_change, 2)
-                        
-                        # If we have at least a year of data
-                        if len(data) >= 12 and not pd.isna(data.iloc[-1]) and not pd.isna(data.iloc[-12]) and data.iloc[-12] != 0:
-                            # Calculate year-over-year change (assuming monthly data)
-                            yoy_change = float(((data.iloc[-1] / data.iloc[-12]) - 1) * 100)
-                            summary["year_over_year_pct_change"] = round(yoy_change, 2)
-                    
-                    # Get metadata and convert to serializable dict if requested
-                    metadata = None
-                    if include_metadata:
-                        try:
-                            info = fred.get_series_info(series_id)
-                            metadata = {
-                                "id": info.get("id", ""),
-                                "title": info.get("title", ""),
-                                "units": info.get("units", ""),
-                                "frequency": info.get("frequency", ""),
-                                "seasonal_adjustment": info.get("seasonal_adjustment", ""),
-                                "notes": info.get("notes", "")
-                            }
-                        except Exception as e:
-                            metadata = {"error": str(e)}
-                    
-                    result[series_id] = {
-                        "series_id": series_id,
-                        "data": data_dict,
-                        "summary": summary,
-                        "metadata": metadata
-                    }
-                except Exception as e:
-                    result[series_id] = {"error": str(e)}
+        Returns:
+            A dictionary of series data keyed by series ID.
+        """
+        semaphore = asyncio.Semaphore(MAX_FRED_WORKERS)
+        
+        async def fetch(fn: Callable[..., Dict[str, Any]], *fn_args: Any) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(fn, *fn_args)
+        
+        # Every series and metadata lookup is an independent blocking request,
+        # so run them concurrently in worker threads
+        fetches = [
+            fetch(self._get_series, series_id, args.observation_start, args.observation_end)
+            for series_id in args.series_ids
+        ]
+        if args.include_metadata:
+            fetches.extend(fetch(self._get_metadata, series_id) for series_id in args.series_ids)
+        results = await asyncio.gather(*fetches, return_exceptions=True)
+        
+        series_count = len(args.series_ids)
+        series_results = results[:series_count]
+        metadata_results = results[series_count:] or [None] * series_count
+        
+        result = {}
+        for series_id, series, metadata in zip(args.series_ids, series_results, metadata_results):
+            if isinstance(series, Exception):
+                result[series_id] = {"error": str(series)}
+            else:
+                series["metadata"] = metadata
+                result[series_id] = series
+        
+        return result
+
+    @staticmethod
+    def _is_complete(result: Dict[str, Any]) -> bool:
+        """Return whether no series or metadata lookup failed."""
+        return not any("error" in entry or "error" in (entry.get("metadata") or {}) for entry in result.values())
+
+    def _get_series(self, series_id: str, observation_start: Optional[str], observation_end: Optional[str]) -> Dict[str, Any]:
+        """Get the observations and summary statistics for a single series.
+        
+        Args:
+            series_id: The FRED series ID.
+            observation_start: Start date for data in format YYYY-MM-DD.
+            observation_end: End date for data in format YYYY-MM-DD.
+            
+        Returns:
+            A dictionary with the series data and summary.
+        """
+        import numpy as np
+        
+        data = cache.cached(
+            "fred.get_series", SERIES_TTL,
+            lambda series_id, **kwargs: self.fred.get_series(series_id, **kwargs),
+            series_id, observation_start=observation_start, observation_end=observation_end
+        )
+        
+        # Calculate summary statistics if we have data
+        summary = {}
+        if len(data) > 0:
+            values = data.to_numpy(dtype=float)
+            last = values[-1]
+            
+            # Get the most recent value
+            summary["most_recent_value"] = None if np.isnan(last) else float(last)
+            summary["most_recent_date"] = data.index[-1].strftime('%Y-%m-%d')
             
-            return json.dumps(result, indent=2, cls=CustomJSONEncoder)
+            # Missing data, too few observations and zero bases all yield non-finite changes
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # Calculate period-over-period change
+                previous = values[-2] if values.size > 1 else np.nan
+                pop_change = (last / previous - 1) * 100
+                if np.isfinite(pop_change):
+                    summary["period_over_period_pct_change"] = round(float(pop_change), 2)
+                
+                # Calculate year-over-year change (assuming monthly data)
+                year_ago = values[-13] if values.size > 12 else np.nan
+                yoy_change = (last / year_ago - 1) * 100
+                if np.isfinite(yoy_change):
+                    summary["year_over_year_pct_change"] = round(float(yoy_change), 2)
+        
+        # Bound the output size of long, high-frequency series
+        observations = data
+        resampled = False
+        if len(observations) > MAX_OBSERVATIONS:
+            # Keep each month's last observation under its real date rather than
+            # relabeling it with the month end, which may lie in the future
+            monthly = observations.groupby(observations.index.to_period("M")).tail(1)
+            if len(monthly) < len(observations):
+                observations = monthly
+                resampled = True
+        observations = observations.round(OBSERVATION_DECIMALS)
+        
+        # Convert the Series to a dictionary with string dates, mapping missing values to None
+        dates = observations.index.strftime('%Y-%m-%d').tolist()
+        values = observations.to_numpy(dtype=object)
+        values[observations.isna().to_numpy()] = None
+        data_dict = dict(zip(dates, values.tolist()))
+        
+        return {
+            "series_id": series_id,
+            "data": data_dict,
+            "resampled_monthly": resampled,
+            "summary": summary
+        }
+
+    def _get_metadata(self, series_id: str) -> Dict[str, Any]:
+        """Get metadata for a single series as a serializable dict.
+        
+        Args:
+            series_id: The FRED series ID.
+            
+        Returns:
+            A dictionary of series metadata, or an error entry.
+        """
+        metadata = self._metadata.get(series_id)
+        if metadata is not None:
+            return metadata
+        
+        try:
+            info = cache.cached("fred.get_series_info", METADATA_TTL, lambda series_id: self.fred.get_series_info(series_id), series_id)
+            metadata = {
+                "id": info.get("id", ""),
+                "title": info.get("title", ""),
+                "units": info.get("units", ""),
+                "frequency": info.get("frequency", ""),
+                "seasonal_adjustment": info.get("seasonal_adjustment", ""),
+                "notes": info.get("notes", "")
+            }
         except Exception as e:
-            return f"Error: {str(e)}" 
\ No newline at end of file
+            return {"error": str(e)}
+        
+        self._metadata[series_id] = metadata
+        return metadata
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Memory tool for saving messages to a memory file."""
 
+import asyncio
+import atexit
 from typing import Any, Dict
 
 from robots.tools.base import Tool
@@ -8,6 +10,14 @@ from robots.tools.base import Tool
 class MemoryTool(Tool):
     """Tool for saving messages to a memory file."""
 
+    def __init__(self):
+        """Initialize the memory tool."""
+        # Keep the file open for the life of the process; line buffering flushes each entry
+        self._file = open("memory.txt", "a", buffering=1)
+        atexit.register(self._file.close)
+        # Parallel tool calls may save several messages at once
+        self._lock = asyncio.Lock()
+
     @property
     def name(self) -> str:
         """Return the name of the tool."""
@@ -37,8 +47,8 @@ class MemoryTool(Tool):
             Confirmation message.
         """
         try:
-            with open("memory.txt", "a") as f:
-                f.write(f"---\n{input_data['message']}\n")
+            async with self._lock:
+                await asyncio.to_thread(self._file.write, f"---\n{input_data['message']}\n")
             return "Message added to memory"
         except Exception as e:
             return f"Error: {str(e)}" 
\ No newline at end of file
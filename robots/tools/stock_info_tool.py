@@ -1,12 +1,24 @@
 """Stock information tool using yfinance."""
 
-import json
+import asyncio
 from typing import Any, Dict, List
 
-import yfinance as yf
+import msgspec
 
 from robots.tools.base import Tool
-from robots.utils.json_encoder import CustomJSONEncoder
+from robots.utils import cache, http
+
+# How long fetched data is reused, in seconds
+PRICE_HISTORY_TTL = 15 * 60
+COMPANY_INFO_TTL = 24 * 60 * 60
+
+
+class StockInfoInput(msgspec.Struct):
+    """Input for the stock info tool."""
+
+    tickers: List[str] = []
+    period: str = "1mo"
+    info: bool = True
 
 
 class StockInfoTool(Tool):
@@ -57,52 +69,124 @@ class StockInfoTool(Tool):
             JSON string with stock information.
         """
         try:
-            ticker_symbols = input_data.get("tickers", [])
-            period = input_data.get("period", "1mo")
-            include_info = input_data.get("info", True)
+            args = msgspec.convert(input_data, StockInfoInput)
             
-            if not ticker_symbols:
+            if not args.tickers:
                 return "Error: No ticker symbols provided"
             
-            result = {}
+            # yf.download upper-cases its columns, so look up and cache by the same symbols
+            args.tickers = [ticker.upper() for ticker in args.tickers]
             
-            # Get ticker information
-            tickers = yf.Tickers(" ".join(ticker_symbols))
+            return await cache.cached_result(
+                self.name, args, PRICE_HISTORY_TTL,
+                lambda: self._fetch(args), self._is_complete
+            )
+        except Exception as e:
+            return f"Error retrieving stock data: {str(e)}"
+
+    async def _fetch(self, args: StockInfoInput) -> Dict[str, Any]:
+        """Fetch price history and, if requested, company info for the tickers.
+        
+        Args:
+            args: The parsed tool input.
             
-            # Get historical data
-            hist_data = yf.download(ticker_symbols, period=period)
+        Returns:
+            A dictionary with the historical data and company info.
+        """
+        # Price history and each ticker's company info are separate blocking
+        # requests, so run them all concurrently in worker threads
+        fetches = [asyncio.to_thread(self._get_historical, args.tickers, args.period)]
+        if args.info:
+            fetches.extend(asyncio.to_thread(self._get_company_info, ticker) for ticker in args.tickers)
+        historical, *infos = await asyncio.gather(*fetches)
+        
+        result = {"historical": historical}
+        
+        # Add company info if requested
+        if args.info:
+            result["info"] = dict(zip(args.tickers, infos))
+        
+        return result
+
+    @staticmethod
+    def _is_complete(result: Dict[str, Any]) -> bool:
+        """Return whether every ticker has a price and no company info lookup failed."""
+        prices = result["historical"]["tickers"].values()
+        infos = result.get("info", {}).values()
+        return all(price["last_price"] is not None for price in prices) and not any(
+            "error" in info for info in infos
+        )
+
+    @staticmethod
+    def _get_historical(tickers: List[str], period: str) -> Dict[str, Any]:
+        """Get the last price and change over a period for each ticker.
+        
+        Args:
+            tickers: The ticker symbols.
+            period: Time period for historical data.
             
-            # Format the result
-            result["historical"] = {
-                "start_date": hist_data.index[0].strftime("%Y-%m-%d"),
-                "end_date": hist_data.index[-1].strftime("%Y-%m-%d"),
-                "tickers": {}
+        Returns:
+            A dictionary with the date range and per-ticker prices.
+        """
+        import pandas as pd
+        import yfinance as yf
+        
+        # yf.download reports failed tickers by leaving their columns empty
+        # rather than raising, so only store frames with data for every ticker
+        key = (tickers, period)
+        hist_data = cache.get("yf.download", key)
+        if hist_data is None:
+            hist_data = yf.download(tickers, period=period, threads=True, session=http.get_session())
+            close = hist_data.get("Close")
+            if not hist_data.empty and close is not None and all(
+                ticker in close and close[ticker].notna().any() for ticker in tickers
+            ):
+                cache.put("yf.download", key, hist_data, PRICE_HISTORY_TTL)
+        
+        # Format the result
+        historical = {
+            "start_date": hist_data.index[0].strftime("%Y-%m-%d"),
+            "end_date": hist_data.index[-1].strftime("%Y-%m-%d"),
+            "tickers": {}
+        }
+        
+        # Compute last prices and changes for all tickers at once
+        close = hist_data['Close']
+        last_prices = close.iloc[-1]
+        change_percents = (last_prices / close.iloc[0] - 1) * 100
+        
+        # Add last price for each ticker
+        for ticker in tickers:
+            last_price = last_prices.get(ticker)
+            change_percent = change_percents.get(ticker)
+            historical["tickers"][ticker] = {
+                "last_price": None if pd.isna(last_price) else round(float(last_price), 2),
+                "change_percent": None if pd.isna(change_percent) else round(float(change_percent), 2)
             }
+        
+        return historical
+
+    @staticmethod
+    def _get_company_info(ticker: str) -> Dict[str, Any]:
+        """Get company information for a single ticker.
+        
+        Args:
+            ticker: The ticker symbol.
             
-            # Add last price for each ticker
-            for ticker in ticker_symbols:
-                result["historical"]["tickers"][ticker] = {
-                    "last_price": round(float(hist_data['Close'][ticker].iloc[-1]), 2) if ticker in hist_data else None,
-                    "change_percent": round(float(100 * (hist_data['Close'][ticker].iloc[-1] / hist_data['Close'][ticker].iloc[0] - 1)), 2) if ticker in hist_data else None
-                }
-            
-            # Add company info if requested
-            if include_info:
-                result["info"] = {}
-                for ticker in ticker_symbols:
-                    try:
-                        info = tickers.tickers[ticker].info
-                        result["info"][ticker] = {
-                            "name": info.get("shortName"),
-                            "sector": info.get("sector"),
-                            "industry": info.get("industry"),
-                            "website": info.get("website"),
-                            "market_cap": info.get("marketCap"),
-                            "pe_ratio": info.get("trailingPE")
-                        }
-                    except Exception as e:
-                        result["info"][ticker] = {"error": str(e)}
-            
-            return json.dumps(result, indent=2, cls=CustomJSONEncoder)
+        Returns:
+            A dictionary of company information, or an error entry.
+        """
+        import yfinance as yf
+        
+        try:
+            info = cache.cached("yf.info", COMPANY_INFO_TTL, lambda symbol: yf.Ticker(symbol, session=http.get_session()).info, ticker)
+            return {
+                "name": info.get("shortName"),
+                "sector": info.get("sector"),
+                "industry": info.get("industry"),
+                "website": info.get("website"),
+                "market_cap": info.get("marketCap"),
+                "pe_ratio": info.get("trailingPE")
+            }
         except Exception as e:
-            return f"Error retrieving stock data: {str(e)}" 
\ No newline at end of file
+            return {"error": str(e)} 
\ No newline at end of file
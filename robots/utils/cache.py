@@ -0,0 +1,112 @@
+"""Persistent TTL cache for results of remote data lookups."""
+
+import hashlib
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import diskcache
+import msgspec
+
+from robots.utils import json_encoder
+
+T = TypeVar("T")
+
+# Directory holding the on-disk cache, relative to the working directory
+CACHE_DIR = ".cache"
+
+_MISSING = object()
+_cache: Optional[diskcache.Cache] = None
+
+
+def _get_cache() -> diskcache.Cache:
+    """Return the shared cache, opening it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = diskcache.Cache(CACHE_DIR)
+    return _cache
+
+
+def _make_key(name: str, key: Any) -> str:
+    """Hash a name and key into a cache key."""
+    return hashlib.md5(repr((name, key)).encode()).hexdigest()
+
+
+def get(name: str, key: Any, default: Any = None) -> Any:
+    """Get a stored value.
+
+    Args:
+        name: A stable name identifying the kind of value.
+        key: A value with a deterministic repr identifying the entry.
+        default: The value to return on a miss.
+
+    Returns:
+        The stored value, or the default if it is missing or expired.
+    """
+    return _get_cache().get(_make_key(name, key), default=default)
+
+
+def put(name: str, key: Any, value: Any, ttl: float) -> None:
+    """Store a value.
+
+    Args:
+        name: A stable name identifying the kind of value.
+        key: A value with a deterministic repr identifying the entry.
+        value: The value to store.
+        ttl: How long the value stays valid, in seconds.
+    """
+    _get_cache().set(_make_key(name, key), value, expire=ttl)
+
+
+def cached(name: str, ttl: float, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call a function, reusing a stored result while it is fresh.
+
+    Results are keyed on the name and the call arguments and pickled to
+    disk, so they survive restarts. Exceptions are not cached.
+
+    Args:
+        name: A stable name identifying the function being called.
+        ttl: How long a stored result stays valid, in seconds.
+        fn: The function to call on a cache miss.
+        *args: Positional arguments for the function.
+        **kwargs: Keyword arguments for the function.
+
+    Returns:
+        The stored or freshly computed result.
+    """
+    key = (args, sorted(kwargs.items()))
+    value = get(name, key, _MISSING)
+    if value is _MISSING:
+        value = fn(*args, **kwargs)
+        put(name, key, value, ttl)
+    return value
+
+
+async def cached_result(
+    name: str,
+    args: msgspec.Struct,
+    ttl: float,
+    build: Callable[[], Awaitable[Any]],
+    is_complete: Callable[[Any], bool],
+) -> str:
+    """Build a tool result as JSON, reusing the output of an identical recent call.
+
+    Only complete results are stored, so transient failures are retried
+    on the next call.
+
+    Args:
+        name: The name of the tool.
+        args: The tool's parsed input, which identifies the call.
+        ttl: How long a stored result stays valid, in seconds.
+        build: Coroutine function producing the result on a cache miss.
+        is_complete: Whether a result is free of failures and may be stored.
+
+    Returns:
+        The stored or freshly built result, serialized to JSON.
+    """
+    key = msgspec.structs.astuple(args)
+    output = get(name, key)
+    if output is None:
+        result = await build()
+        output = json_encoder.dumps(result)
+        if is_complete(result):
+            put(name, key, output, ttl)
+    return output
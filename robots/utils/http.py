@@ -0,0 +1,71 @@
+"""Shared HTTP session for remote data lookups."""
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+# Hosts to open connections to ahead of the next tool call
+PREWARM_URLS = ("https://query2.finance.yahoo.com",)
+
+# Seconds to wait on a warm-up request before giving up
+PREWARM_TIMEOUT = 2
+
+
+@functools.cache
+def get_session() -> "requests.Session":
+    """Return the shared session, creating it on first use.
+
+    The session keeps connections alive and pools them so concurrent
+    workers reuse sockets instead of paying a TLS handshake per request.
+
+    Returns:
+        The shared session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2)
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.cache
+def _get_prewarm_adapter() -> "HTTPAdapter":
+    """Return an adapter that opens connections in the shared pool without retrying."""
+    from requests.adapters import HTTPAdapter
+    
+    adapter = HTTPAdapter(max_retries=0)
+    adapter.poolmanager = get_session().get_adapter("https://").poolmanager
+    return adapter
+
+
+def prewarm() -> None:
+    """Open pooled connections to the data hosts, ignoring failures.
+
+    Warm-up requests are sent once with a short timeout, so a slow or
+    unreachable host cannot hold up shutdown.
+    """
+    import requests
+    
+    session = get_session()
+    adapter = _get_prewarm_adapter()
+    for url in PREWARM_URLS:
+        try:
+            # Resolve settings as the session does, so the connection lands in the same pool
+            request = session.prepare_request(requests.Request("HEAD", url))
+            settings = session.merge_environment_settings(url, {}, None, None, None)
+            response = adapter.send(request, timeout=PREWARM_TIMEOUT, **settings)
+            # Return the connection to the pool instead of closing it
+            response.raw.drain_conn()
+            response.raw.release_conn()
+        except requests.RequestException:
+            pass
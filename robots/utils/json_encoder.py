@@ -1,19 +1,37 @@
-"""Custom JSON encoder for handling non-serializable types."""
+"""JSON serialization helpers for handling non-serializable types."""
 
-import json
-import numpy as np
-import pandas as pd
+from typing import Any
 
+import orjson
 
-class CustomJSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle numpy and pandas objects."""
+
+def _default(obj: Any) -> Any:
+    """Convert types orjson cannot serialize natively."""
+    import pandas as pd
     
-    def default(self, obj):
-        """Override the default method to handle non-serializable types."""
-        if isinstance(obj, (np.integer, np.floating, np.bool_)):
-            return obj.item()
-        if isinstance(obj, pd.Timestamp):
-            return obj.strftime('%Y-%m-%d')
-        if pd.isna(obj):
-            return None
-        return super(CustomJSONEncoder, self).default(obj) 
\ No newline at end of file
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if pd.isna(obj):
+        return None
+    return str(obj)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Output is not indented, since it is read by the model rather than a
+    person and whitespace costs input tokens. NumPy scalars and arrays
+    are handled natively by orjson; pandas timestamps and missing values
+    go through the default hook.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The JSON string.
+    """
+    return orjson.dumps(
+        obj,
+        default=_default,
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    ).decode()